@@ -18,15 +18,101 @@ Usage:
 """
 
 import os
+import functools
 import sys
+import random
 import argparse
-import base64
-import requests
+import binascii
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List
 
 API_BASE = "https://api.venice.ai/api/v1"
 
 
+@functools.lru_cache(maxsize=1)
+def _get_api_key() -> str:
+    """Read and validate VENICE_API_KEY once per process."""
+    api_key = os.environ.get("VENICE_API_KEY")
+    if not api_key:
+        raise ValueError("VENICE_API_KEY environment variable not set")
+    return api_key
+
+
+# Created lazily on first API call so CLI startup (--help, argument
+# errors) doesn't pay the requests/httpx import cost; the lock keeps
+# batch_generate workers from racing the first initialization
+_session = None
+_session_lock = threading.Lock()
+
+
+def _make_session():
+    """Build the shared HTTP client.
+
+    Prefers an HTTP/2 httpx client when httpx (with h2) is installed, so
+    concurrent batch_generate requests multiplex over a single TLS
+    connection; otherwise falls back to a pooled requests session. Both
+    expose the post/json/raise_for_status calls used here.
+    """
+    try:
+        import httpx
+        return httpx.Client(
+            http2=True,
+            timeout=60,
+            limits=httpx.Limits(max_keepalive_connections=20)
+        )
+    except ImportError:
+        pass
+
+    import requests
+    from requests.adapters import HTTPAdapter
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+    # The JSON responses here are mostly base64 image data, which
+    # compresses well; advertise brotli on top of the default
+    # gzip/deflate, but only when a decoder is installed so urllib3 can
+    # transparently decode it
+    try:
+        import brotlicffi  # noqa: F401
+        session.headers["Accept-Encoding"] = "br, gzip, deflate"
+    except ImportError:
+        try:
+            import brotli  # noqa: F401
+            session.headers["Accept-Encoding"] = "br, gzip, deflate"
+        except ImportError:
+            pass
+
+    return session
+
+
+def _get_session(api_key: str):
+    """Return the shared HTTP client with the Authorization header set."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _make_session()
+    auth = f"Bearer {api_key}"
+    if _session.headers.get("Authorization") != auth:
+        _session.headers["Authorization"] = auth
+    return _session
+
+
+def _b64_decode_to_file(b64_data: str, f, chunk_size: int = 1 << 18):
+    """Decode a base64 payload to an open file in chunks.
+
+    Caps peak memory at one decoded chunk instead of the whole image,
+    which matters with several multi-MB variants in one response.
+    """
+    # a2b_base64 needs chunks aligned to 4-character groups; API payloads
+    # come unwrapped, but strip any line breaks defensively
+    if "\n" in b64_data or "\r" in b64_data:
+        b64_data = b64_data.replace("\r", "").replace("\n", "")
+    for i in range(0, len(b64_data), chunk_size):
+        f.write(binascii.a2b_base64(b64_data[i:i + chunk_size]))
+
+
 def generate_image(
     prompt: str,
     model: str = "z-image-turbo",
@@ -41,14 +127,42 @@ def generate_image(
     format: str = "png",
     variants: int = 1,
     hide_watermark: bool = True,
+    client_parallel_variants: bool = False,
     api_key: Optional[str] = None
 ):
     """Generate an image using Venice.ai API."""
-    
-    api_key = api_key or os.environ.get("VENICE_API_KEY")
-    if not api_key:
-        raise ValueError("VENICE_API_KEY environment variable not set")
-    
+
+    api_key = api_key or _get_api_key()
+
+    # Optionally fan variants out as concurrent single-variant requests
+    # (with consecutive seeds), so a backend that renders variants
+    # serially overlaps them instead
+    if variants > 1 and client_parallel_variants:
+        base_seed = seed if seed is not None else random.randrange(1 << 31)
+        base, _, ext = output.rpartition(".")
+        with ThreadPoolExecutor(max_workers=min(variants, 4)) as executor:
+            futures = [
+                executor.submit(
+                    generate_image,
+                    prompt=prompt,
+                    model=model,
+                    output=f"{base}_{i + 1}.{ext}",
+                    width=width,
+                    height=height,
+                    aspect_ratio=aspect_ratio,
+                    resolution=resolution,
+                    negative_prompt=negative_prompt,
+                    cfg_scale=cfg_scale,
+                    seed=base_seed + i,
+                    format=format,
+                    variants=1,
+                    hide_watermark=hide_watermark,
+                    api_key=api_key
+                )
+                for i in range(variants)
+            ]
+            return [name for future in futures for name in future.result()]
+
     payload = {
         "model": model,
         "prompt": prompt,
@@ -69,30 +183,63 @@ def generate_image(
     if seed is not None:
         payload["seed"] = seed
     
-    response = requests.post(
+    response = _get_session(api_key).post(
         f"{API_BASE}/image/generate",
-        headers={"Authorization": f"Bearer {api_key}"},
         json=payload
     )
     
     response.raise_for_status()
     data = response.json()
     
-    # Save images
+    # Save images - parse the output name once rather than per variant
+    images = data["images"]
+    base, _, ext = output.rpartition(".")
     saved_files = []
-    for i, img_data in enumerate(data["images"]):
-        filename = output if len(data["images"]) == 1 else f"{output.rsplit('.', 1)[0]}_{i+1}.{output.rsplit('.', 1)[1]}"
+    for i, img_data in enumerate(images):
+        filename = output if len(images) == 1 else f"{base}_{i + 1}.{ext}"
         with open(filename, "wb") as f:
-            f.write(base64.b64decode(img_data))
+            _b64_decode_to_file(img_data, f)
         saved_files.append(filename)
         print(f"Saved: {filename}")
     
     return saved_files
 
 
+def batch_generate(
+    prompts: List[str],
+    output: str = "generated_image.png",
+    max_concurrency: int = 5,
+    **kwargs
+) -> List[List[str]]:
+    """Generate images for many prompts concurrently.
+
+    A bounded thread pool overlaps the network waits over the shared
+    pooled session, so batch throughput is limited by the API rate
+    rather than per-request round-trip time. Extra keyword arguments
+    are forwarded to generate_image; each prompt's files are named
+    {output base}_{n}.{ext} by position.
+    """
+
+    base, _, ext = output.rpartition(".")
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        futures = [
+            executor.submit(
+                generate_image,
+                prompt=prompt,
+                output=f"{base}_{i + 1}.{ext}",
+                **kwargs
+            )
+            for i, prompt in enumerate(prompts)
+        ]
+        return [future.result() for future in futures]
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate images using Venice.ai (cost-effective defaults)")
-    parser.add_argument("prompt", help="Image description/prompt")
+    parser.add_argument("prompt", nargs="?", help="Image description/prompt")
+    parser.add_argument("--prompts-file",
+                        help="File with one prompt per line; prompts are generated "
+                             "concurrently (alternative to the positional prompt)")
     parser.add_argument("--model", default="z-image-turbo",
                         help="Model to use (default: z-image-turbo for fast, cost-efficient generation. Use nano-banana-pro for premium quality)")
     parser.add_argument("--output", "-o", default="generated_image.png", help="Output filename")
@@ -105,15 +252,20 @@ def main():
     parser.add_argument("--seed", type=int, help="Random seed for reproducibility")
     parser.add_argument("--format", default="png", choices=["png", "jpeg", "webp"], help="Output format")
     parser.add_argument("--variants", type=int, default=1, help="Number of variants (1-4)")
+    parser.add_argument("--client-parallel-variants", action="store_true",
+                        help="Request variants as concurrent single-variant calls "
+                             "with consecutive seeds instead of one batched call")
     parser.add_argument("--watermark", action="store_true", help="Show Venice watermark (default: hidden)")
     
     args = parser.parse_args()
-    
+
+    if bool(args.prompt) == bool(args.prompts_file):
+        print("Error: Provide either a prompt or --prompts-file", file=sys.stderr)
+        sys.exit(1)
+
     try:
-        files = generate_image(
-            prompt=args.prompt,
+        common_kwargs = dict(
             model=args.model,
-            output=args.output,
             width=args.width,
             height=args.height,
             aspect_ratio=args.aspect_ratio,
@@ -123,8 +275,21 @@ def main():
             seed=args.seed,
             format=args.format,
             variants=args.variants,
-            hide_watermark=not args.watermark
+            hide_watermark=not args.watermark,
+            client_parallel_variants=args.client_parallel_variants
         )
+
+        if args.prompts_file:
+            with open(args.prompts_file) as f:
+                prompts = [line.strip() for line in f if line.strip()]
+            if not prompts:
+                print("Error: No prompts found in file", file=sys.stderr)
+                sys.exit(1)
+            results = batch_generate(prompts, output=args.output, **common_kwargs)
+            files = [name for batch in results for name in batch]
+        else:
+            files = generate_image(prompt=args.prompt, output=args.output,
+                                   **common_kwargs)
         print(f"\nSuccessfully generated {len(files)} image(s)")
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -15,15 +15,78 @@ Video Models Reference: https://docs.venice.ai/models/video
 """
 
 import os
+import functools
 import sys
+import mmap
 import argparse
 import time
 import base64
-import requests
 from typing import Optional, List
 
 API_BASE = "https://api.venice.ai/api/v1"
 
+
+@functools.lru_cache(maxsize=1)
+def _get_api_key() -> str:
+    """Read and validate VENICE_API_KEY once per process."""
+    api_key = os.environ.get("VENICE_API_KEY")
+    if not api_key:
+        raise ValueError("VENICE_API_KEY environment variable not set")
+    return api_key
+
+
+# Created lazily on first API call so CLI startup (--help, model
+# selection, argument errors) doesn't pay the requests import cost
+_session = None
+
+
+def _make_adapter():
+    """Build the connection pool adapter with Nagle's algorithm disabled,
+    so the tiny JSON poll bodies are dispatched immediately instead of
+    waiting to coalesce with data that never comes."""
+    import socket
+    from requests.adapters import HTTPAdapter
+    from urllib3.connection import HTTPConnection
+
+    class LowLatencyAdapter(HTTPAdapter):
+        def init_poolmanager(self, *args, **kwargs):
+            kwargs["socket_options"] = \
+                list(HTTPConnection.default_socket_options) + [
+                    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                ]
+            return super().init_poolmanager(*args, **kwargs)
+
+    return LowLatencyAdapter(pool_connections=4, pool_maxsize=16)
+
+
+def _get_session(api_key: str):
+    """Return the shared session with the Authorization header set.
+
+    Keep-alive connections are reused across the quote/queue/poll calls.
+    """
+    global _session
+    if _session is None:
+        import requests
+        _session = requests.Session()
+        _session.mount("https://", _make_adapter())
+
+        # Advertise brotli for the JSON quote/queue/poll responses, but
+        # only when a decoder is installed so urllib3 can transparently
+        # decode it
+        try:
+            import brotlicffi  # noqa: F401
+            _session.headers["Accept-Encoding"] = "br, gzip, deflate"
+        except ImportError:
+            try:
+                import brotli  # noqa: F401
+                _session.headers["Accept-Encoding"] = "br, gzip, deflate"
+            except ImportError:
+                pass
+    auth = f"Bearer {api_key}"
+    if _session.headers.get("Authorization") != auth:
+        _session.headers["Authorization"] = auth
+    return _session
+
 # Common video models - check https://docs.venice.ai/models/video for current list
 AVAILABLE_MODELS = {
     "1": ("wan-2.5-preview-image-to-video", "Image to Video (Recommended for most use cases)"),
@@ -41,9 +104,7 @@ def get_video_quote(
 ) -> float:
     """Get price quote for video generation."""
     
-    api_key = api_key or os.environ.get("VENICE_API_KEY")
-    if not api_key:
-        raise ValueError("VENICE_API_KEY environment variable not set")
+    api_key = api_key or _get_api_key()
     
     payload = {
         "model": model,
@@ -54,9 +115,8 @@ def get_video_quote(
     if aspect_ratio:
         payload["aspect_ratio"] = aspect_ratio
     
-    response = requests.post(
+    response = _get_session(api_key).post(
         f"{API_BASE}/video/quote",
-        headers={"Authorization": f"Bearer {api_key}"},
         json=payload
     )
     
@@ -64,6 +124,17 @@ def get_video_quote(
     return response.json()["quote"]
 
 
+def _encode_image_data_url(image_path: str) -> str:
+    """Base64-encode an image file as a data URL.
+
+    Encodes straight from a read-only memory map, so the raw file bytes
+    are never duplicated into an intermediate Python object.
+    """
+    with open(image_path, "rb") as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return "data:image/png;base64," + base64.b64encode(mm).decode("ascii")
+
+
 def queue_video(
     image_path: str,
     prompt: str,
@@ -78,20 +149,14 @@ def queue_video(
 ) -> str:
     """Queue a video generation request. Returns queue_id."""
     
-    api_key = api_key or os.environ.get("VENICE_API_KEY")
-    if not api_key:
-        raise ValueError("VENICE_API_KEY environment variable not set")
-    
-    # Read and encode image
-    with open(image_path, "rb") as f:
-        image_data = base64.b64encode(f.read()).decode("utf-8")
+    api_key = api_key or _get_api_key()
     
     payload = {
         "model": model,
         "prompt": prompt,
         "duration": duration,
         "resolution": resolution,
-        "image_url": f"data:image/png;base64,{image_data}",
+        "image_url": _encode_image_data_url(image_path),
         "audio": audio
     }
     
@@ -100,16 +165,12 @@ def queue_video(
     if negative_prompt:
         payload["negative_prompt"] = negative_prompt
     if reference_images:
-        ref_encoded = []
-        for ref_path in reference_images:
-            with open(ref_path, "rb") as f:
-                ref_data = base64.b64encode(f.read()).decode("utf-8")
-            ref_encoded.append(f"data:image/png;base64,{ref_data}")
-        payload["reference_image_urls"] = ref_encoded
+        payload["reference_image_urls"] = [
+            _encode_image_data_url(ref_path) for ref_path in reference_images
+        ]
     
-    response = requests.post(
+    response = _get_session(api_key).post(
         f"{API_BASE}/video/queue",
-        headers={"Authorization": f"Bearer {api_key}"},
         json=payload
     )
     
@@ -127,34 +188,43 @@ def retrieve_video(
 ) -> str:
     """Poll for video completion and download when ready."""
     
-    api_key = api_key or os.environ.get("VENICE_API_KEY")
-    if not api_key:
-        raise ValueError("VENICE_API_KEY environment variable not set")
+    api_key = api_key or _get_api_key()
     
     print(f"Polling for video completion (queue_id: {queue_id})...")
-    
+
+    backoff = float(poll_interval)
     while True:
-        response = requests.post(
+        with _get_session(api_key).post(
             f"{API_BASE}/video/retrieve",
-            headers={"Authorization": f"Bearer {api_key}"},
             json={
                 "model": model,
                 "queue_id": queue_id,
                 "delete_media_on_completion": delete_on_completion
-            }
-        )
-        
-        response.raise_for_status()
-        
-        content_type = response.headers.get("content-type", "")
-        
-        if "video/mp4" in content_type:
-            # Video is ready
-            with open(output, "wb") as f:
-                f.write(response.content)
-            print(f"\nVideo saved: {output}")
-            return output
-        else:
+            },
+            stream=True
+        ) as response:
+            response.raise_for_status()
+
+            content_type = response.headers.get("content-type", "")
+
+            if "video/mp4" in content_type:
+                # Video is ready - stream it to disk in 1 MB chunks with
+                # a running byte counter so the download shows progress
+                total = int(response.headers.get("content-length", 0))
+                received = 0
+                with open(output, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=1 << 20):
+                        f.write(chunk)
+                        received += len(chunk)
+                        if total:
+                            print(f"Downloading... {received / 1e6:.1f}/"
+                                  f"{total / 1e6:.1f} MB", end="\r")
+                        else:
+                            print(f"Downloading... {received / 1e6:.1f} MB",
+                                  end="\r")
+                print(f"\nVideo saved: {output}")
+                return output
+
             # Still processing
             data = response.json()
             status = data.get("status", "UNKNOWN")
@@ -163,7 +233,15 @@ def retrieve_video(
                 exec_time = data.get("execution_duration", 0)
                 avg_time = data.get("average_execution_time", 0)
                 print(f"Processing... {exec_time/1000:.1f}s / {avg_time/1000:.1f}s estimated", end="\r")
-                time.sleep(poll_interval)
+
+                # Back off while the server's own estimate says the job is
+                # far from done; poll tightly again once completion is close.
+                remaining = max(0, (avg_time - exec_time) / 1000)
+                if remaining < 2 * backoff:
+                    time.sleep(poll_interval)
+                else:
+                    time.sleep(min(30, max(backoff, remaining * 0.5)))
+                    backoff = min(30, backoff * 1.5)
             else:
                 print(f"\nUnexpected status: {status}")
                 raise RuntimeError(f"Unexpected status: {status}")
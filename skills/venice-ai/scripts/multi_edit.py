@@ -2,53 +2,162 @@
 """
 Venice AI Multi-Editor
 
-Apply multiple edits to an image sequentially.
+Apply multiple edits to an image sequentially, or independently in parallel.
 
 Usage:
     python multi_edit.py input.png "Change sky to sunset" "Add birds" "Enhance shadows"
     python multi_edit.py photo.jpg "Remove person" "Change background to beach" --save-steps
+    python multi_edit.py product.png "Change color to red" "Add gold accents" --parallel
 """
 
 import os
+import functools
 import sys
+import mmap
 import argparse
-import requests
-from typing import Optional, List
+import hashlib
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Union
 
 API_BASE = "https://api.venice.ai/api/v1"
 
 
+@functools.lru_cache(maxsize=1)
+def _get_api_key() -> str:
+    """Read and validate VENICE_API_KEY once per process."""
+    api_key = os.environ.get("VENICE_API_KEY")
+    if not api_key:
+        raise ValueError("VENICE_API_KEY environment variable not set")
+    return api_key
+
+
+# Content-addressed cache of edit results, so re-running a prompt chain
+# only pays the API cost for steps that actually changed
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "venice-ai", "edits")
+
+# Created lazily on first API call so CLI startup (--help, argument
+# errors, cache hits) doesn't pay the requests import cost; the lock
+# keeps --parallel workers from racing the first initialization
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_session(api_key: str):
+    """Return the shared session with the Authorization header set."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                session = requests.Session()
+                session.mount("https://",
+                              HTTPAdapter(pool_connections=4, pool_maxsize=16))
+                _session = session
+    auth = f"Bearer {api_key}"
+    if _session.headers.get("Authorization") != auth:
+        _session.headers["Authorization"] = auth
+    return _session
+
+
+def _cache_path(image_buf, prompt: str, model: str,
+                aspect_ratio: Optional[str]) -> str:
+    """Cache file for one edit, keyed by image content and edit parameters."""
+    h = hashlib.sha256()
+    h.update(image_buf)
+    h.update(prompt.encode("utf-8"))
+    h.update(model.encode("utf-8"))
+    if aspect_ratio:
+        h.update(aspect_ratio.encode("utf-8"))
+    return os.path.join(CACHE_DIR, h.hexdigest() + ".png")
+
+
+def _write_atomic(path: str, data: bytes):
+    """Write bytes to a file atomically (temp file + os.replace), so an
+    interrupted run never leaves a partial file behind."""
+    dest_dir = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=dest_dir, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _cache_store(cache_path: str, image_bytes: bytes):
+    """Write a cache entry atomically so interrupted runs never leave
+    a partial file behind."""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    _write_atomic(cache_path, image_bytes)
+
+
 def apply_edit(
-    image_path: str,
+    image: Union[str, bytes],
     prompt: str,
     model: str = "qwen-edit",
     aspect_ratio: Optional[str] = None,
+    use_cache: bool = True,
     api_key: Optional[str] = None
 ) -> bytes:
-    """Apply a single edit to an image. Returns image bytes."""
-    
-    api_key = api_key or os.environ.get("VENICE_API_KEY")
-    if not api_key:
-        raise ValueError("VENICE_API_KEY environment variable not set")
-    
-    with open(image_path, "rb") as f:
-        files = {"image": f}
-        data = {
-            "prompt": prompt,
-            "modelId": model
-        }
-        if aspect_ratio:
-            data["aspect_ratio"] = aspect_ratio
-        
-        response = requests.post(
-            f"{API_BASE}/image/edit",
-            headers={"Authorization": f"Bearer {api_key}"},
-            files=files,
-            data=data
-        )
-    
-    response.raise_for_status()
-    return response.content
+    """Apply a single edit to an image (file path or raw bytes).
+
+    Returns the edited image bytes.
+    """
+
+    api_key = api_key or _get_api_key()
+
+    if isinstance(image, bytes):
+        return _edit_buffer(image, "image.png", prompt, model,
+                            aspect_ratio, use_cache, api_key)
+
+    # Memory-map file inputs so hashing and upload read straight from
+    # the page cache instead of copying the file into a bytes buffer
+    with open(image, "rb") as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return _edit_buffer(mm, os.path.basename(image), prompt, model,
+                            aspect_ratio, use_cache, api_key)
+
+
+def _edit_buffer(
+    image_buf,
+    filename: str,
+    prompt: str,
+    model: str,
+    aspect_ratio: Optional[str],
+    use_cache: bool,
+    api_key: str
+) -> bytes:
+    """Run one edit request over an in-memory buffer (bytes or mmap)."""
+
+    cache_path = _cache_path(image_buf, prompt, model, aspect_ratio)
+    if use_cache and os.path.exists(cache_path):
+        print("  (cached)")
+        with open(cache_path, "rb") as f:
+            return f.read()
+
+    files = {"image": (filename, image_buf, "image/png")}
+    data = {
+        "prompt": prompt,
+        "modelId": model
+    }
+    if aspect_ratio:
+        data["aspect_ratio"] = aspect_ratio
+
+    # The sequential pipeline needs the bytes in memory for the next
+    # step, so no disk streaming here; the context manager guarantees
+    # the connection is released back to the pool.
+    with _get_session(api_key).post(
+        f"{API_BASE}/image/edit",
+        files=files,
+        data=data
+    ) as response:
+        response.raise_for_status()
+        result = response.content
+
+    if use_cache:
+        _cache_store(cache_path, result)
+
+    return result
 
 
 def multi_edit(
@@ -58,66 +167,99 @@ def multi_edit(
     model: str = "qwen-edit",
     save_steps: bool = False,
     aspect_ratio: Optional[str] = None,
+    use_cache: bool = True,
     api_key: Optional[str] = None
 ) -> str:
-    """Apply multiple edits sequentially to an image."""
-    
-    current_path = image_path
-    step_files = []
-    
-    for i, edit_prompt in enumerate(edits):
-        step_num = i + 1
-        print(f"[{step_num}/{len(edits)}] Applying: {edit_prompt}")
-        
-        # Apply edit
-        image_bytes = apply_edit(
-            image_path=current_path,
-            prompt=edit_prompt,
-            model=model,
-            aspect_ratio=aspect_ratio,
-            api_key=api_key
-        )
-        
-        # Determine output path for this step
-        if save_steps:
-            base_name = os.path.splitext(output)[0]
-            step_path = f"{base_name}_step{step_num}.png"
-            step_files.append(step_path)
-        else:
-            step_path = f".temp_step_{step_num}.png"
-        
-        # Save result
-        with open(step_path, "wb") as f:
-            f.write(image_bytes)
-        
-        # Update current path for next iteration
-        if not save_steps and step_num > 1:
-            # Clean up previous temp file
-            try:
-                os.remove(current_path)
-            except:
-                pass
-        
-        current_path = step_path
-        print(f"  -> Saved: {step_path}")
-    
-    # Rename final result to output name
-    if current_path != output:
-        os.rename(current_path, output)
-        print(f"\nFinal result: {output}")
-    
-    # Clean up temp files if not saving steps
-    if not save_steps:
-        for step_file in step_files:
-            try:
-                if os.path.exists(step_file):
-                    os.remove(step_file)
-            except:
-                pass
-    
+    """Apply multiple edits sequentially to an image.
+
+    Intermediate results stay in memory between steps; they only touch
+    disk when --save-steps is requested or for the final output.
+    """
+
+    with open(image_path, "rb") as f:
+        current_bytes = f.read()
+
+    base_name = os.path.splitext(output)[0]
+
+    # A single background writer hides each step's disk write behind the
+    # next step's network round-trip; one worker keeps writes ordered
+    write_futures = []
+    with ThreadPoolExecutor(max_workers=1) as writer:
+        for i, edit_prompt in enumerate(edits):
+            step_num = i + 1
+            print(f"[{step_num}/{len(edits)}] Applying: {edit_prompt}")
+
+            # Apply edit
+            current_bytes = apply_edit(
+                image=current_bytes,
+                prompt=edit_prompt,
+                model=model,
+                aspect_ratio=aspect_ratio,
+                use_cache=use_cache,
+                api_key=api_key
+            )
+
+            # Save intermediate steps only when requested (the final step
+            # is written as the output below)
+            if save_steps and step_num < len(edits):
+                step_path = f"{base_name}_step{step_num}.png"
+                write_futures.append(
+                    writer.submit(_write_atomic, step_path, current_bytes))
+                print(f"  -> Saved: {step_path}")
+
+    # Exiting the pool waited for pending writes; surface any failures
+    for future in write_futures:
+        future.result()
+
+    _write_atomic(output, current_bytes)
+    print(f"\nFinal result: {output}")
+
     return output
 
 
+def parallel_edit(
+    image_path: str,
+    edits: List[str],
+    output: str = "final_edit.png",
+    model: str = "qwen-edit",
+    aspect_ratio: Optional[str] = None,
+    use_cache: bool = True,
+    api_key: Optional[str] = None
+) -> List[str]:
+    """Apply independent edits to the original image concurrently.
+
+    Each prompt is applied to the untouched input image, so edits that
+    don't depend on each other overlap their network waits instead of
+    paying one round-trip per edit. Results are written as
+    {output base}_variant{n}.png.
+    """
+
+    with ThreadPoolExecutor(max_workers=len(edits)) as executor:
+        futures = [
+            executor.submit(
+                apply_edit,
+                image=image_path,
+                prompt=edit_prompt,
+                model=model,
+                aspect_ratio=aspect_ratio,
+                use_cache=use_cache,
+                api_key=api_key
+            )
+            for edit_prompt in edits
+        ]
+        results = [future.result() for future in futures]
+
+    base_name = os.path.splitext(output)[0]
+    variant_files = []
+    for i, image_bytes in enumerate(results):
+        variant_path = f"{base_name}_variant{i + 1}.png"
+        _write_atomic(variant_path, image_bytes)
+        variant_files.append(variant_path)
+        print(f"  -> Saved: {variant_path}")
+
+    return variant_files
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Apply multiple edits to an image sequentially",
@@ -138,8 +280,13 @@ Examples:
                         help="Edit model to use")
     parser.add_argument("--save-steps", action="store_true",
                         help="Save intermediate steps as separate files")
+    parser.add_argument("--parallel", action="store_true",
+                        help="Apply each edit to the original image concurrently "
+                             "(for independent edits; saves one variant per prompt)")
     parser.add_argument("--aspect-ratio", help="Output aspect ratio (e.g., 16:9)")
-    
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always call the API, ignoring cached edit results")
+
     args = parser.parse_args()
     
     if not os.path.exists(args.image):
@@ -152,18 +299,30 @@ Examples:
     
     try:
         print(f"Applying {len(args.edits)} edit(s) to {args.image}\n")
-        
-        final_file = multi_edit(
-            image_path=args.image,
-            edits=args.edits,
-            output=args.output,
-            model=args.model,
-            save_steps=args.save_steps,
-            aspect_ratio=args.aspect_ratio
-        )
-        
-        print(f"\nSuccessfully applied all edits!")
-        print(f"Final output: {final_file}")
+
+        if args.parallel:
+            variant_files = parallel_edit(
+                image_path=args.image,
+                edits=args.edits,
+                output=args.output,
+                model=args.model,
+                aspect_ratio=args.aspect_ratio,
+                use_cache=not args.no_cache
+            )
+            print(f"\nSuccessfully applied all edits!")
+            print(f"Variants: {', '.join(variant_files)}")
+        else:
+            final_file = multi_edit(
+                image_path=args.image,
+                edits=args.edits,
+                output=args.output,
+                model=args.model,
+                save_steps=args.save_steps,
+                aspect_ratio=args.aspect_ratio,
+                use_cache=not args.no_cache
+            )
+            print(f"\nSuccessfully applied all edits!")
+            print(f"Final output: {final_file}")
         
     except Exception as e:
         print(f"\nError: {e}", file=sys.stderr)
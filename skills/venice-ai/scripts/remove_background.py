@@ -10,14 +10,44 @@ Usage:
 """
 
 import os
+import functools
 import sys
+import mmap
+import shutil
 import argparse
-import requests
 from typing import Optional
 
 API_BASE = "https://api.venice.ai/api/v1"
 
 
+@functools.lru_cache(maxsize=1)
+def _get_api_key() -> str:
+    """Read and validate VENICE_API_KEY once per process."""
+    api_key = os.environ.get("VENICE_API_KEY")
+    if not api_key:
+        raise ValueError("VENICE_API_KEY environment variable not set")
+    return api_key
+
+
+# Created lazily on first API call so CLI startup (--help, argument
+# errors) doesn't pay the requests import cost
+_session = None
+
+
+def _get_session(api_key: str):
+    """Return the shared session with the Authorization header set."""
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        _session = requests.Session()
+        _session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+    auth = f"Bearer {api_key}"
+    if _session.headers.get("Authorization") != auth:
+        _session.headers["Authorization"] = auth
+    return _session
+
+
 def remove_background(
     image_path: str,
     output: str = "no_background.png",
@@ -25,25 +55,26 @@ def remove_background(
 ):
     """Remove background from an image using Venice.ai API."""
     
-    api_key = api_key or os.environ.get("VENICE_API_KEY")
-    if not api_key:
-        raise ValueError("VENICE_API_KEY environment variable not set")
+    api_key = api_key or _get_api_key()
     
-    with open(image_path, "rb") as f:
-        files = {"image": f}
-        
-        response = requests.post(
+    # Memory-map the input so the upload reads straight from the page
+    # cache instead of copying the file into a bytes buffer first
+    with open(image_path, "rb") as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        files = {"image": (os.path.basename(image_path), mm, "image/png")}
+
+        response = _get_session(api_key).post(
             f"{API_BASE}/image/remove-background",
-            headers={"Authorization": f"Bearer {api_key}"},
-            files=files
+            files=files,
+            stream=True
         )
-    
-    response.raise_for_status()
-    
-    # Save image with transparent background
-    with open(output, "wb") as f:
-        f.write(response.content)
-    
+
+    # Stream the image with transparent background to disk
+    with response:
+        response.raise_for_status()
+        with open(output, "wb") as f:
+            shutil.copyfileobj(response.raw, f, length=1024 * 1024)
+
     return output
 
 
@@ -10,14 +10,66 @@ Usage:
 """
 
 import os
+import functools
 import sys
+import mmap
+import shutil
 import argparse
-import requests
+import contextlib
 from typing import Optional
 
 API_BASE = "https://api.venice.ai/api/v1"
 
 
+@functools.lru_cache(maxsize=1)
+def _get_api_key() -> str:
+    """Read and validate VENICE_API_KEY once per process."""
+    api_key = os.environ.get("VENICE_API_KEY")
+    if not api_key:
+        raise ValueError("VENICE_API_KEY environment variable not set")
+    return api_key
+
+
+# Created lazily on first API call so CLI startup (--help, argument
+# errors) doesn't pay the requests import cost
+_session = None
+
+
+def _get_session(api_key: str):
+    """Return the shared session with the Authorization header set."""
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        _session = requests.Session()
+        _session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+    auth = f"Bearer {api_key}"
+    if _session.headers.get("Authorization") != auth:
+        _session.headers["Authorization"] = auth
+    return _session
+
+
+def _downsize_image(image_path: str, max_edge: int) -> Optional[bytes]:
+    """Re-encode an image capped at max_edge pixels on its longest side.
+
+    Returns PNG bytes, or None when the image is already small enough.
+    Requires Pillow; only used when --max-edge is given.
+    """
+    from io import BytesIO
+    try:
+        from PIL import Image
+    except ImportError:
+        raise RuntimeError("--max-edge requires Pillow (pip install Pillow)")
+
+    with Image.open(image_path) as im:
+        if max(im.size) <= max_edge:
+            return None
+        im.thumbnail((max_edge, max_edge), Image.LANCZOS)
+        buf = BytesIO()
+        im.save(buf, "PNG", optimize=True)
+    return buf.getvalue()
+
+
 def upscale_image(
     image_path: str,
     output: str = "upscaled_image.png",
@@ -26,16 +78,27 @@ def upscale_image(
     enhance_creativity: float = 0.5,
     enhance_prompt: str = "",
     replication: float = 0.35,
+    max_edge: Optional[int] = None,
     api_key: Optional[str] = None
 ):
     """Upscale/enhance an image using Venice.ai API."""
-    
-    api_key = api_key or os.environ.get("VENICE_API_KEY")
-    if not api_key:
-        raise ValueError("VENICE_API_KEY environment variable not set")
-    
-    with open(image_path, "rb") as f:
-        files = {"image": f}
+
+    api_key = api_key or _get_api_key()
+
+    # Optionally downsize oversized inputs locally so the upload is a
+    # fraction of the bytes (useful when enhancing huge camera photos)
+    resized = _downsize_image(image_path, max_edge) if max_edge else None
+
+    # Memory-map the input so the upload reads straight from the page
+    # cache instead of copying the file into a bytes buffer first
+    with contextlib.ExitStack() as stack:
+        if resized is not None:
+            image_buf = resized
+        else:
+            f = stack.enter_context(open(image_path, "rb"))
+            image_buf = stack.enter_context(
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        files = {"image": (os.path.basename(image_path), image_buf, "image/png")}
         data = {
             "scale": scale,
             "enhance": str(enhance).lower(),
@@ -47,19 +110,19 @@ def upscale_image(
             if enhance_prompt:
                 data["enhancePrompt"] = enhance_prompt
         
-        response = requests.post(
+        response = _get_session(api_key).post(
             f"{API_BASE}/image/upscale",
-            headers={"Authorization": f"Bearer {api_key}"},
             files=files,
-            data=data
+            data=data,
+            stream=True
         )
-    
-    response.raise_for_status()
-    
-    # Save upscaled image
-    with open(output, "wb") as f:
-        f.write(response.content)
-    
+
+    # Stream the upscaled image to disk instead of buffering it in memory
+    with response:
+        response.raise_for_status()
+        with open(output, "wb") as f:
+            shutil.copyfileobj(response.raw, f, length=1024 * 1024)
+
     return output
 
 
@@ -77,6 +140,9 @@ def main():
                         help="Enhancement style prompt (e.g., 'crisp details', 'gold')")
     parser.add_argument("--replication", type=float, default=0.35,
                         help="Replication strength (0-1, higher = preserve more original)")
+    parser.add_argument("--max-edge", type=int,
+                        help="Downsize the input so its longest edge is at most "
+                             "this many pixels before upload (requires Pillow)")
     
     args = parser.parse_args()
     
@@ -96,7 +162,8 @@ def main():
             enhance=args.enhance,
             enhance_creativity=args.enhance_creativity,
             enhance_prompt=args.enhance_prompt,
-            replication=args.replication
+            replication=args.replication,
+            max_edge=args.max_edge
         )
         print(f"Saved upscaled image: {output_file}")
     except Exception as e: